@@ -42,6 +42,7 @@ from igraph.formula import *
 from igraph.layout import *
 from igraph.matching import *
 from igraph.operators import *
+from igraph.sparse_matrix import _graph_from_sparse_matrix
 from igraph.statistics import *
 from igraph.summary import *
 from igraph.utils import *
@@ -266,11 +267,25 @@ class Graph(GraphBase):
 
         @param es: the list of edges to be added. Every edge is represented
           with a tuple containing the vertex IDs or names of the two
-          endpoints. Vertices are enumerated from zero.
+          endpoints. Vertices are enumerated from zero. A NumPy array or
+          matrix with two columns is also accepted.
         @param attributes: dict of sequences, all of length equal to the
           number of edges to be added, containing the attributes of the new
           edges.
         """
+        # When 'es' is a NumPy array or matrix of non-negative integers,
+        # convert it into a memoryview as the lower-level C API works with
+        # memoryviews only. The C API does not validate the items of a
+        # memoryview, so anything else (e.g. floats, negative numbers or
+        # vertex names) is iterated row by row instead.
+        try:
+            from numpy import ndarray, matrix
+            if isinstance(es, (ndarray, matrix)) and \
+                    es.dtype.kind in "iu" and not (es < 0).any():
+                es = numpy_to_contiguous_memoryview(es)
+        except ImportError:
+            pass
+
         eid = self.ecount()
         res = GraphBase.add_edges(self, es)
         n = self.ecount() - eid
@@ -607,9 +622,10 @@ class Graph(GraphBase):
                 type = GET_ADJACENCY_BOTH
 
         if eids:
-            result = Matrix(GraphBase.get_adjacency(self, type, eids))
-            result -= 1
-            return result
+            # The C layer returns edge IDs shifted by one so that zero can
+            # denote unconnected vertex pairs
+            data = GraphBase.get_adjacency(self, type, eids)
+            return Matrix([[eid - 1 for eid in row] for row in data])
 
         if attribute is None:
             return Matrix(GraphBase.get_adjacency(self, type))
@@ -654,21 +670,30 @@ class Graph(GraphBase):
             raise ImportError('You should install scipy package in order to use this function')
         import numpy as np
 
-        edges = self.get_edgelist()
+        edges = np.array(self.get_edgelist(), dtype=int).reshape(-1, 2)
+        rows, cols = edges[:, 0], edges[:, 1]
         if attribute is None:
-            weights = [1] * len(edges)
+            weights = np.ones(len(edges), dtype=int)
         else:
             if attribute not in self.es.attribute_names():
                 raise ValueError("Attribute does not exist")
 
-            weights = self.es[attribute]
-
-        N = self.vcount()
-        mtx = sparse.csr_matrix((weights, zip(*edges)), shape=(N, N))
+            weights = np.asarray(self.es[attribute])
 
         if not self.is_directed():
-            mtx = mtx + sparse.triu(mtx, 1).T + sparse.tril(mtx, -1).T
-        return mtx
+            # Mirror every non-loop edge so the matrix becomes symmetric;
+            # loop edges must appear only once in the diagonal
+            mask = rows != cols
+            rows, cols = (
+                np.concatenate((rows, cols[mask])),
+                np.concatenate((cols, rows[mask]))
+            )
+            weights = np.concatenate((weights, weights[mask]))
+
+        # Duplicate entries (i.e. multi-edges) are summed up during the
+        # conversion from COO to CSR format
+        N = self.vcount()
+        return sparse.coo_matrix((weights, (rows, cols)), shape=(N, N)).tocsr()
 
     def get_adjlist(self, mode=OUT):
         """get_adjlist(mode=OUT)
@@ -3018,6 +3043,41 @@ class Graph(GraphBase):
         result.vs["y"] = ys
         return result
 
+    @classmethod
+    def Adjacency(klass, matrix, mode=ADJ_DIRECTED):
+        """Adjacency(matrix, mode=ADJ_DIRECTED)
+
+        Generates a graph from its adjacency matrix.
+
+        @param matrix: the adjacency matrix. It may also be a SciPy sparse
+          matrix, in which case the edges are generated from its nonzero
+          entries without constructing a dense matrix first.
+        @param mode: the mode to be used. Possible values are:
+
+          - C{ADJ_DIRECTED} - the graph will be directed and a matrix
+            element gives the number of edges between two vertex.
+          - C{ADJ_UNDIRECTED} - alias to C{ADJ_MAX} for convenience.
+          - C{ADJ_MAX}   - undirected graph will be created and the number of
+            edges between vertex M{i} and M{j} is M{max(A(i,j), A(j,i))}
+          - C{ADJ_MIN}   - like C{ADJ_MAX}, but with M{min(A(i,j), A(j,i))}
+          - C{ADJ_PLUS}  - like C{ADJ_MAX}, but with M{A(i,j) + A(j,i)}
+          - C{ADJ_UPPER} - undirected graph with the upper right triangle of
+            the matrix (including the diagonal)
+          - C{ADJ_LOWER} - undirected graph with the lower left triangle of
+            the matrix (including the diagonal)
+
+          These values can also be given as strings without the C{ADJ} prefix.
+        """
+        if not isinstance(matrix, list):
+            try:
+                from scipy import sparse
+            except ImportError:
+                sparse = None
+            if sparse is not None and sparse.issparse(matrix):
+                return _graph_from_sparse_matrix(klass, matrix, mode=mode)
+
+        return super(Graph, klass).Adjacency(matrix, mode=mode)
+
     @classmethod
     def Incidence(klass, *args, **kwds):
         """Incidence(matrix, directed=False, mode=ALL, multiple=False, weighted=None)
@@ -4174,6 +4234,32 @@ class VertexSeq(_igraph.VertexSeq):
         """
         return self.select(*args, **kwds)
 
+    def __setitem__(self, attrname, values):
+        """Sets the values of the given vertex attribute for all vertices in
+        the sequence.
+
+        This method simply passes its arguments to the lower-level C API,
+        except that NumPy arrays are converted into lists in one go
+        beforehand, otherwise a separate NumPy scalar would be created for
+        every single vertex.
+        """
+        values = _numpy_array_to_list(values)
+        _igraph.VertexSeq.__setitem__(self, attrname, values)
+
+    def set_attribute_values(self, attrname, values):
+        """set_attribute_values(attrname, values)
+
+        Sets the value of a given vertex attribute for all vertices.
+
+        NumPy arrays are converted into lists in one go, just like in
+        L{VertexSeq.__setitem__()}.
+
+        @param attrname: the name of the attribute
+        @param values: the new attribute values in a list
+        """
+        values = _numpy_array_to_list(values)
+        _igraph.VertexSeq.set_attribute_values(self, attrname, values)
+
 ##############################################################
 
 class EdgeSeq(_igraph.EdgeSeq):
@@ -4583,6 +4669,47 @@ class EdgeSeq(_igraph.EdgeSeq):
         """
         return self.select(*args, **kwds)
 
+    def __setitem__(self, attrname, values):
+        """Sets the values of the given edge attribute for all edges in
+        the sequence.
+
+        This method simply passes its arguments to the lower-level C API,
+        except that NumPy arrays are converted into lists in one go
+        beforehand, otherwise a separate NumPy scalar would be created for
+        every single edge.
+        """
+        values = _numpy_array_to_list(values)
+        _igraph.EdgeSeq.__setitem__(self, attrname, values)
+
+    def set_attribute_values(self, attrname, values):
+        """set_attribute_values(attrname, values)
+
+        Sets the value of a given edge attribute for all edges.
+
+        NumPy arrays are converted into lists in one go, just like in
+        L{EdgeSeq.__setitem__()}.
+
+        @param attrname: the name of the attribute
+        @param values: the new attribute values in a list
+        """
+        values = _numpy_array_to_list(values)
+        _igraph.EdgeSeq.set_attribute_values(self, attrname, values)
+
+
+def _numpy_array_to_list(values):
+    """Converts a NumPy array of booleans or numbers into a list of native
+    Python objects and leaves any other object intact (including NumPy arrays
+    of other types such as C{datetime64}, whose items would lose their type).
+
+    NumPy is not imported here; if it has not been imported yet, C{values}
+    cannot be a NumPy array anyway.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray) and \
+            values.dtype.kind in "biuf":
+        return values.tolist()
+    return values
+
 ##############################################################
 # Additional methods of VertexSeq and EdgeSeq that call Graph methods
 
@@ -0,0 +1,133 @@
+# vim:ts=4:sw=4:sts=4:et
+# -*- coding: utf-8 -*-
+"""Implementation of Python-level sparse matrix operations.
+
+@undocumented: _graph_from_sparse_matrix
+"""
+
+from igraph._igraph import (
+    ADJ_DIRECTED, ADJ_UNDIRECTED, ADJ_MAX, ADJ_MIN, ADJ_PLUS, ADJ_UPPER,
+    ADJ_LOWER
+)
+
+__all__ = ()
+__license__ = u"""\
+Copyright (C) 2006-2012  Tamás Nepusz <ntamas@gmail.com>
+Pázmány Péter sétány 1/a, 1117 Budapest, Hungary
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc.,  51 Franklin Street, Fifth Floor, Boston, MA
+02110-1301 USA
+"""
+
+# Same entries as the translation table used by the C layer for the dense
+# adjacency matrix constructor
+_ADJACENCY_MODES = (
+    ("directed", ADJ_DIRECTED),
+    ("undirected", ADJ_UNDIRECTED),
+    ("upper", ADJ_UPPER),
+    ("lower", ADJ_LOWER),
+    ("minimum", ADJ_MIN),
+    ("maximum", ADJ_MAX),
+    ("plus", ADJ_PLUS),
+)
+
+
+def _adjacency_mode_from_string(mode):
+    """Translates the name of an adjacency mode into the corresponding
+    C{ADJ_*} constant.
+
+    Mirrors C{igraphmodule_PyObject_to_enum()}: an exact match wins;
+    otherwise the name sharing the longest common prefix with C{mode} is
+    used, provided that it is unique.
+    """
+    name = mode.lower()
+    best, best_unique, best_result = 0, False, None
+    for candidate, value in _ADJACENCY_MODES:
+        if name == candidate:
+            return value
+        i = 0
+        while i < min(len(name), len(candidate)) and name[i] == candidate[i]:
+            i += 1
+        if i > best:
+            best, best_unique, best_result = i, True, value
+        elif i == best:
+            best_unique = False
+    if best_unique:
+        return best_result
+    raise ValueError("invalid adjacency mode: %r" % mode)
+
+
+def _graph_from_sparse_matrix(klass, matrix, mode=ADJ_DIRECTED):
+    """Constructs a graph from a SciPy sparse adjacency matrix.
+
+    The edges are generated from the nonzero entries of the matrix only,
+    so the matrix is never converted into a dense representation. The
+    semantics of the C{mode} argument match those of L{Graph.Adjacency}:
+    every matrix entry gives the number of edges between two vertices.
+
+    @param klass: the graph class to construct
+    @param matrix: the adjacency matrix as a SciPy sparse matrix
+    @param mode: the mode to be used; see L{Graph.Adjacency} for the
+      possible values
+    @return: the constructed graph
+    """
+    # Deferred import to prevent a hard dependency on SciPy and NumPy
+    from scipy import sparse
+    import numpy as np
+
+    if mode is None:
+        mode = ADJ_DIRECTED
+    elif isinstance(mode, basestring):
+        mode = _adjacency_mode_from_string(mode)
+
+    nrow, ncol = matrix.shape
+    if nrow != ncol:
+        raise ValueError("adjacency matrix must be square")
+
+    # Upcast before any arithmetic (including the summation of duplicate
+    # entries), otherwise boolean matrices would be added with logical OR
+    # and small integer types could overflow
+    if matrix.dtype.kind in "biu":
+        matrix = matrix.astype(np.int64)
+    else:
+        matrix = matrix.astype(np.float64)
+    matrix = sparse.csr_matrix(matrix)
+    if mode == ADJ_DIRECTED:
+        pass
+    elif mode in (ADJ_MAX, ADJ_UNDIRECTED):
+        matrix = sparse.triu(matrix.maximum(matrix.T))
+    elif mode == ADJ_MIN:
+        matrix = sparse.triu(matrix.minimum(matrix.T))
+    elif mode == ADJ_PLUS:
+        # The diagonal must be counted only once
+        matrix = sparse.triu(matrix) + sparse.tril(matrix, -1).T
+    elif mode == ADJ_UPPER:
+        matrix = sparse.triu(matrix)
+    elif mode == ADJ_LOWER:
+        matrix = sparse.tril(matrix)
+    else:
+        raise ValueError("invalid adjacency mode: %r" % mode)
+
+    # Convert to canonical CSR format first so the edges are generated in
+    # row-major order, just like for dense adjacency matrices
+    matrix = sparse.csr_matrix(matrix)
+    matrix.sum_duplicates()
+    matrix = matrix.tocoo()
+
+    counts = np.maximum(matrix.data.astype(int), 0)
+    edges = np.column_stack((
+        np.repeat(matrix.row, counts), np.repeat(matrix.col, counts)
+    ))
+    return klass(nrow, edges, mode == ADJ_DIRECTED)
@@ -226,6 +226,33 @@ class BasicTests(unittest.TestCase):
             g.es['color'],
             [None, None, None, None, None, None, 'k', 'b'])
 
+    @unittest.skipIf(np is None, "test case depends on NumPy")
+    def testAddEdgesWithNumPy(self):
+        g = Graph(4)
+
+        g.add_edges(np.array([(0, 1), (1, 0)], dtype=np.int32))
+        self.assertEqual(g.get_edgelist(), [(0, 1), (0, 1)])
+
+        # Sliced NumPy array -- the sliced array is non-contiguous but we
+        # automatically make it so
+        arr = np.array([(1, 2), (10, 11), (2, 3), (11, 12)])
+        g.add_edges(arr[::2, :], attributes={"weight": [2, 3]})
+        self.assertEqual(g.get_edgelist(), [(0, 1), (0, 1), (1, 2), (2, 3)])
+        self.assertEqual(g.es["weight"], [None, None, 2, 3])
+
+        # 1D NumPy array -- should raise a TypeError because we need a 2D array
+        self.assertRaises(TypeError, g.add_edges, np.array([0, 1, 1, 2]))
+
+        # Non-integral and negative vertex IDs must be rejected
+        self.assertRaises(TypeError, g.add_edges, np.array([[0.5, 1.7]]))
+        self.assertRaises(ValueError, g.add_edges, np.array([[0, -1]]))
+        self.assertEqual(g.ecount(), 4)
+
+        # NumPy array with vertex names
+        g.vs["name"] = ["spam", "bacon", "eggs", "ham"]
+        g.add_edges(np.array([("spam", "ham"), ("eggs", "bacon")]))
+        self.assertEqual(g.get_edgelist()[-2:], [(0, 3), (1, 2)])
+
     def testDeleteEdges(self):
         g = Graph.Famous("petersen")
         g.vs["name"] = list("ABCDEFGHIJ")
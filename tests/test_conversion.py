@@ -1,6 +1,18 @@
 import unittest
 from igraph import *
 
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+
+def _sparse_equal(A, B):
+    """Compares a sparse matrix with a dense or sparse one without densifying
+    the sparse matrix."""
+    return (A != sparse.csr_matrix(B)).nnz == 0
+
+
 class DirectedUndirectedTests(unittest.TestCase):
     def testToUndirected(self):
         graph = Graph([(0,1), (0,2), (1,0)], directed=True)
@@ -43,12 +55,32 @@ class DirectedUndirectedTests(unittest.TestCase):
                 [(0,1), (0,2), (1,0), (2,0), (2,3), (2,4), (3,2), (4,2)]
         )
 
+    def testToDirectedArbitrary(self):
+        graph = Graph([(0,1), (0,2), (2,3), (2,4)], directed=False)
+        graph.to_directed(mutual=False)
+        self.assertTrue(graph.is_directed())
+        self.assertTrue(graph.vcount() == 5)
+        self.assertTrue(graph.ecount() == 4)
+
+        el_set = set(graph.get_edgelist())
+        for edge in [(0,1), (0,2), (2,3), (2,4)]:
+            self.assertTrue(el_set & set([edge, edge[::-1]]))
+
 
 class GraphRepresentationTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The test cases below do not modify these graphs so they can be
+        # shared between them
+        cls._tree_u = Graph.Tree(6, 3)
+        cls._tree_u.es["weight"] = range(5)
+
+        cls._tree_d = Graph.Tree(6, 3, "tree_out")
+        cls._tree_d.add_edges([(0,1), (1,0)])
+
     def testGetAdjacency(self):
         # Undirected case
-        g = Graph.Tree(6, 3)
-        g.es["weight"] = range(5)
+        g = self._tree_u
         self.assertTrue(g.get_adjacency() == Matrix([
             [0, 1, 1, 1, 0, 0],
             [1, 0, 0, 0, 1, 1],
@@ -66,17 +98,16 @@ class GraphRepresentationTests(unittest.TestCase):
             [0, 4, 0, 0, 0, 0]
         ]))
         self.assertTrue(g.get_adjacency(eids=True) == Matrix([
-            [0, 1, 2, 3, 0, 0],
-            [1, 0, 0, 0, 4, 5],
-            [2, 0, 0, 0, 0, 0],
-            [3, 0, 0, 0, 0, 0],
-            [0, 4, 0, 0, 0, 0],
-            [0, 5, 0, 0, 0, 0]
-        ])-1)
+            [-1,  0,  1,  2, -1, -1],
+            [ 0, -1, -1, -1,  3,  4],
+            [ 1, -1, -1, -1, -1, -1],
+            [ 2, -1, -1, -1, -1, -1],
+            [-1,  3, -1, -1, -1, -1],
+            [-1,  4, -1, -1, -1, -1]
+        ]))
 
         # Directed case
-        g = Graph.Tree(6, 3, "tree_out")
-        g.add_edges([(0,1), (1,0)])
+        g = self._tree_d
         self.assertTrue(g.get_adjacency() == Matrix([
             [0, 2, 1, 1, 0, 0],
             [1, 0, 0, 0, 1, 1],
@@ -86,30 +117,32 @@ class GraphRepresentationTests(unittest.TestCase):
             [0, 0, 0, 0, 0, 0]
         ]))
 
+    @unittest.skipIf(sparse is None, "test case depends on SciPy")
     def testGetSparseAdjacency(self):
-        try:
-            from scipy import sparse
-            import numpy as np
-        except ImportError:
-            self.skipTest("Scipy and numpy are dependencies of this test.")
-
         # Undirected case
-        g = Graph.Tree(6, 3)
-        g.es["weight"] = range(5)
-        self.assertTrue(np.all(
-            (g.get_adjacency_sparse() == np.array(g.get_adjacency().data))
+        g = self._tree_u
+        self.assertTrue(_sparse_equal(
+            g.get_adjacency_sparse(), g.get_adjacency().data
         ))
-        self.assertTrue(np.all(
-            (g.get_adjacency_sparse(attribute="weight") == np.array(g.get_adjacency(attribute="weight").data))
+        self.assertTrue(_sparse_equal(
+            g.get_adjacency_sparse(attribute="weight"),
+            g.get_adjacency(attribute="weight").data
         ))
 
         # Directed case
-        g = Graph.Tree(6, 3, "tree_out")
-        g.add_edges([(0,1), (1,0)])
-        self.assertTrue(np.all(
-            g.get_adjacency_sparse() == np.array(g.get_adjacency().data)
+        g = self._tree_d
+        self.assertTrue(_sparse_equal(
+            g.get_adjacency_sparse(), g.get_adjacency().data
         ))
 
+        # Undirected case with a loop edge and multiple edges
+        g = Graph([(0, 1), (1, 0), (1, 2), (2, 2)])
+        expected = sparse.coo_matrix(
+            ([2, 2, 1, 1, 1], ([0, 1, 1, 2, 2], [1, 0, 2, 1, 2])),
+            shape=(3, 3)
+        ).tocsr()
+        self.assertTrue(_sparse_equal(g.get_adjacency_sparse(), expected))
+
 
 def suite():
     direction_suite = unittest.makeSuite(DirectedUndirectedTests)
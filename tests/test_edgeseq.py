@@ -169,6 +169,29 @@ class EdgeSeqTests(unittest.TestCase):
         self.assertEqual(ind, [edge.index for edge in self.g.es[arr.tolist()]])
         self.assertEqual(ind, [edge.index for edge in self.g.es[list(arr)]])
 
+    @skipIf(np is None, "test case depends on NumPy")
+    def testNumPyAttributeAssignment(self):
+        self.g.es["weight"] = np.arange(45, dtype=np.float64)
+        self.assertTrue(self.g.es["weight"] == list(range(45)))
+        self.assertTrue(all(type(w) is float for w in self.g.es["weight"]))
+
+        only_even = self.g.es.select(lambda e: (e.index % 2 == 0))
+        only_even["weight"] = np.array([-1, -2])
+        expected = [[[-1, -2][(i // 2) % 2], i][i % 2] for i in range(45)]
+        self.assertTrue(self.g.es["weight"] == expected)
+
+        self.g.es.set_attribute_values("weight", np.ones(45, dtype=np.int32))
+        self.assertTrue(self.g.es["weight"] == [1] * 45)
+        self.assertTrue(all(type(w) is int for w in self.g.es["weight"]))
+
+        # Non-numeric arrays are stored as they are
+        dates = np.arange(45).astype("datetime64[ns]")
+        self.g.es["date"] = dates
+        self.assertTrue(self.g.es["date"] == list(dates))
+        self.assertTrue(
+            all(isinstance(d, np.datetime64) for d in self.g.es["date"])
+        )
+
     def testPartialAttributeAssignment(self):
         only_even = self.g.es.select(lambda e: (e.index % 2 == 0))
 
@@ -8,6 +8,11 @@ except ImportError:
     np = None
     pd = None
 
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
 
 class GeneratorTests(unittest.TestCase):
     def testStar(self):
@@ -154,6 +159,44 @@ class GeneratorTests(unittest.TestCase):
         pref_matrix[0][1] = 0.7
         self.assertRaises(InternalError, Graph.SBM, 60, pref_matrix, types)
 
+    @unittest.skipIf(sparse is None, "test case depends on SciPy")
+    def testSparseAdjacency(self):
+        mat = [[0, 1, 2, 0], [2, 0, 0, 0], [0, 0, 2, 0], [0, 1, 0, 1]]
+        sparse_mat = sparse.csr_matrix(mat)
+
+        for mode in ("directed", "undirected", "max", "min", "plus",
+                     "upper", "lower", "dir", "un", "lo", None):
+            g = Graph.Adjacency(mat, mode)
+            g2 = Graph.Adjacency(sparse_mat, mode)
+            self.assertTrue(g2.vcount() == 4)
+            self.assertTrue(g2.is_directed() == g.is_directed())
+            self.assertTrue(g2.get_edgelist() == g.get_edgelist())
+
+        g = Graph.Adjacency(sparse.coo_matrix(mat), ADJ_PLUS)
+        self.assertTrue(g.get_edgelist() == [
+            (0,1), (0,1), (0,1), (0,2), (0,2), (1,3), (2,2), (2,2), (3,3)
+        ])
+
+        self.assertRaises(ValueError, Graph.Adjacency,
+                          sparse.csr_matrix([[0, 1, 0], [1, 0, 1]]))
+
+        # Boolean and small integer matrices must not be added up in their
+        # own dtype
+        bool_mat = [[0, 1], [1, 0]]
+        g = Graph.Adjacency(bool_mat, "plus")
+        g2 = Graph.Adjacency(sparse.csr_matrix(bool_mat, dtype=bool), "plus")
+        self.assertTrue(g2.get_edgelist() == g.get_edgelist() == [(0,1), (0,1)])
+
+        uint8_mat = [[0, 200], [200, 0]]
+        g = Graph.Adjacency(uint8_mat, "plus")
+        g2 = Graph.Adjacency(sparse.csr_matrix(uint8_mat, dtype="uint8"), "plus")
+        self.assertTrue(g2.ecount() == g.ecount() == 400)
+        self.assertTrue(g2.get_edgelist() == g.get_edgelist())
+
+        # "u" is an ambiguous prefix of "undirected" and "upper"
+        self.assertRaises(ValueError, Graph.Adjacency, mat, "u")
+        self.assertRaises(ValueError, Graph.Adjacency, sparse_mat, "u")
+
     def testWeightedAdjacency(self):
         mat = [[0, 1, 2, 0], [2, 0, 0, 0], [0, 0, 2.5, 0], [0, 1, 0, 0]]
 
@@ -200,6 +200,29 @@ class VertexSeqTests(unittest.TestCase):
         self.assertEqual(ind, [vertex.index for vertex in self.g.vs[arr.tolist()]])
         self.assertEqual(ind, [vertex.index for vertex in self.g.vs[list(arr)]])
 
+    @skipIf(np is None, "test case depends on NumPy")
+    def testNumPyAttributeAssignment(self):
+        self.g.vs["weight"] = np.arange(10, dtype=np.float64)
+        self.assertTrue(self.g.vs["weight"] == list(range(10)))
+        self.assertTrue(all(type(w) is float for w in self.g.vs["weight"]))
+
+        only_even = self.g.vs.select(lambda v: (v.index % 2 == 0))
+        only_even["weight"] = np.array([-1, -2])
+        expected = [-1, 1, -2, 3, -1, 5, -2, 7, -1, 9]
+        self.assertTrue(self.g.vs["weight"] == expected)
+
+        self.g.vs.set_attribute_values("weight", np.ones(10, dtype=np.int32))
+        self.assertTrue(self.g.vs["weight"] == [1] * 10)
+        self.assertTrue(all(type(w) is int for w in self.g.vs["weight"]))
+
+        # Non-numeric arrays are stored as they are
+        dates = np.arange(10).astype("datetime64[ns]")
+        self.g.vs["date"] = dates
+        self.assertTrue(self.g.vs["date"] == list(dates))
+        self.assertTrue(
+            all(isinstance(d, np.datetime64) for d in self.g.vs["date"])
+        )
+
     def testPartialAttributeAssignment(self):
         only_even = self.g.vs.select(lambda v: (v.index % 2 == 0))
         only_even["test"] = [0] * len(only_even)